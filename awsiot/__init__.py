@@ -8,12 +8,19 @@ __all__ = [
     'iotshadow',
     'greengrass_discovery',
     'mqtt_connection_builder',
+    'set_json_implementation',
 ]
 
 from awscrt import mqtt
 from concurrent.futures import Future
+import functools
 import json
-from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+import sys
+from types import ModuleType
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import datetime
 
 __version__ = '1.0.0-dev'
 
@@ -22,6 +29,83 @@ T = TypeVar('T')
 PayloadObj = Dict[str, Any]
 PayloadToClassFn = Callable[[PayloadObj], T]
 
+# JSON implementation used to encode outgoing MQTT payloads, see set_json_implementation().
+# Incoming payloads are always decoded with the stdlib, since orjson silently decodes
+# integers beyond 64 bits as floats.
+_JSON_IMPL = 'json'
+_orjson = None  # type: Optional[ModuleType]
+
+
+def set_json_implementation(name: str) -> None:
+    """
+    Set the JSON implementation used to encode outgoing MQTT payloads.
+
+    Args:
+        name: 'json' (the default) for the stdlib, or 'orjson' for faster encoding.
+            orjson must be installed (pip install awsiotsdk[orjson]). It isn't a drop-in
+            replacement: it writes NaN/Infinity as null, and payloads it can't encode
+            (such as integers beyond 64 bits) are encoded with the stdlib instead.
+
+    Raises:
+        ValueError: If name isn't a supported implementation.
+        ImportError: If 'orjson' is requested but isn't installed.
+    """
+    global _JSON_IMPL, _orjson
+    if name not in ('json', 'orjson'):
+        raise ValueError("Unsupported JSON implementation '{}', expected 'json' or 'orjson'".format(name))
+    if name == 'orjson' and _orjson is None:
+        import orjson
+        _orjson = orjson
+    _JSON_IMPL = name
+
+
+def _json_dumps(obj: PayloadObj) -> bytes:
+    global _orjson
+    if _JSON_IMPL == 'orjson':
+        if _orjson is None:
+            import orjson
+            _orjson = orjson
+        try:
+            return _orjson.dumps(obj, option=_orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(obj).encode()
+
+
+def _json_loads(payload: bytes) -> PayloadObj:
+    return json.loads(payload)
+
+
+# Callbacks used by MqttServiceClient operations. These live at module scope and are
+# bound to per-operation state with functools.partial, rather than being redefined
+# as closures every time an operation is performed.
+
+def _on_ack_complete(future: Future, ack_future: Future) -> None:
+    if ack_future.exception():
+        future.set_exception(ack_future.exception())
+    else:
+        future.set_result(None)
+
+
+def _on_suback(future: Future, suback_future: Future) -> None:
+    try:
+        suback_result = suback_future.result()
+        future.set_result(suback_result['qos'])
+    except Exception as e:
+        future.set_exception(e)
+
+
+def _on_message(callback: Callable[[T], None],
+                payload_to_class_fn: PayloadToClassFn,
+                topic: str, payload: bytes, dup: bool, qos: int, retain: bool, **kwargs) -> None:
+    try:
+        payload_obj = _json_loads(payload)
+        event = payload_to_class_fn(payload_obj)
+    except BaseException:
+        # can't deliver payload, invoke callback with None
+        event = None
+    callback(event)
+
 
 class MqttServiceClient:
     """
@@ -54,14 +138,8 @@ class MqttServiceClient:
         """
         future = Future()  # type: Future
         try:
-            def on_unsuback(unsuback_future):
-                if unsuback_future.exception():
-                    future.set_exception(unsuback_future.exception())
-                else:
-                    future.set_result(None)
-
             unsub_future, _ = self.mqtt_connection.unsubscribe(topic)
-            unsub_future.add_done_callback(on_unsuback)
+            unsub_future.add_done_callback(functools.partial(_on_ack_complete, future))
 
         except Exception as e:
             future.set_exception(e)
@@ -84,23 +162,17 @@ class MqttServiceClient:
         """
         future = Future()  # type: Future
         try:
-            def on_puback(puback_future):
-                if puback_future.exception():
-                    future.set_exception(puback_future.exception())
-                else:
-                    future.set_result(None)
-
             if payload is None:
-                payload_str = ""
+                payload_bytes = b""
             else:
-                payload_str = json.dumps(payload)
+                payload_bytes = _json_dumps(payload)
 
             pub_future, _ = self.mqtt_connection.publish(
                 topic=topic,
-                payload=payload_str,
+                payload=payload_bytes,
                 qos=qos,
             )
-            pub_future.add_done_callback(on_puback)
+            pub_future.add_done_callback(functools.partial(_on_ack_complete, future))
 
         except Exception as e:
             future.set_exception(e)
@@ -139,28 +211,12 @@ class MqttServiceClient:
 
         future = Future()  # type: Future
         try:
-            def on_suback(suback_future):
-                try:
-                    suback_result = suback_future.result()
-                    future.set_result(suback_result['qos'])
-                except Exception as e:
-                    future.set_exception(e)
-
-            def callback_wrapper(topic, payload, dup, qos, retain, **kwargs):
-                try:
-                    payload_obj = json.loads(payload.decode())
-                    event = payload_to_class_fn(payload_obj)
-                except BaseException:
-                    # can't deliver payload, invoke callback with None
-                    event = None
-                callback(event)
-
             sub_future, _ = self.mqtt_connection.subscribe(
                 topic=topic,
                 qos=qos,
-                callback=callback_wrapper,
+                callback=functools.partial(_on_message, callback, payload_to_class_fn),
             )
-            sub_future.add_done_callback(on_suback)
+            sub_future.add_done_callback(functools.partial(_on_suback, future))
 
         except Exception as e:
             future.set_exception(e)
@@ -185,3 +241,22 @@ class ModeledClass:
             self.__class__.__module__,
             self.__class__.__name__,
             ', '.join(properties))
+
+
+# Helpers called by the generated service modules (iotjobs, ...).
+
+@functools.lru_cache(maxsize=16)
+def _to_datetime(val: float) -> 'datetime.datetime':
+    # bursts of messages tend to carry the same few timestamps, so remember the recent ones.
+    # datetime is imported on first use, it isn't needed until a timestamp is decoded
+    import datetime
+    return datetime.datetime.fromtimestamp(val)
+
+
+def _intern(val: Any) -> Any:
+    # status and error code fields come from a small fixed vocabulary. sys.intern() returns
+    # the same object as the matching string constants (JobStatus.QUEUED, ...), so decoded
+    # values can be compared by identity. Anything that isn't a str is passed through as-is.
+    if type(val) is not str:
+        return val
+    return sys.intern(val)
@@ -5,7 +5,6 @@
 
 import awsiot
 import concurrent.futures
-import datetime
 import typing
 
 class IotJobsClient(awsiot.MqttServiceClient):
@@ -30,7 +29,7 @@ class IotJobsClient(awsiot.MqttServiceClient):
             raise ValueError("request.job_id is required")
 
         return self._publish_operation(
-            topic='$aws/things/{0.thing_name}/jobs/{0.job_id}/get'.format(request),
+            topic=f'$aws/things/{request.thing_name}/jobs/{request.job_id}/get',
             qos=qos,
             payload=request.to_payload())
 
@@ -52,7 +51,7 @@ class IotJobsClient(awsiot.MqttServiceClient):
             raise ValueError("request.thing_name is required")
 
         return self._publish_operation(
-            topic='$aws/things/{0.thing_name}/jobs/get'.format(request),
+            topic=f'$aws/things/{request.thing_name}/jobs/get',
             qos=qos,
             payload=request.to_payload())
 
@@ -74,7 +73,7 @@ class IotJobsClient(awsiot.MqttServiceClient):
             raise ValueError("request.thing_name is required")
 
         return self._publish_operation(
-            topic='$aws/things/{0.thing_name}/jobs/start-next'.format(request),
+            topic=f'$aws/things/{request.thing_name}/jobs/start-next',
             qos=qos,
             payload=request.to_payload())
 
@@ -98,7 +97,7 @@ class IotJobsClient(awsiot.MqttServiceClient):
             raise ValueError("request.job_id is required")
 
         return self._publish_operation(
-            topic='$aws/things/{0.thing_name}/jobs/{0.job_id}/update'.format(request),
+            topic=f'$aws/things/{request.thing_name}/jobs/{request.job_id}/update',
             qos=qos,
             payload=request.to_payload())
 
@@ -131,7 +130,7 @@ class IotJobsClient(awsiot.MqttServiceClient):
             raise ValueError("callback is required")
 
         return self._subscribe_operation(
-            topic='$aws/things/{0.thing_name}/jobs/{0.job_id}/get/accepted'.format(request),
+            topic=f'$aws/things/{request.thing_name}/jobs/{request.job_id}/get/accepted',
             qos=qos,
             callback=callback,
             payload_to_class_fn=DescribeJobExecutionResponse.from_payload)
@@ -165,7 +164,7 @@ class IotJobsClient(awsiot.MqttServiceClient):
             raise ValueError("callback is required")
 
         return self._subscribe_operation(
-            topic='$aws/things/{0.thing_name}/jobs/{0.job_id}/get/rejected'.format(request),
+            topic=f'$aws/things/{request.thing_name}/jobs/{request.job_id}/get/rejected',
             qos=qos,
             callback=callback,
             payload_to_class_fn=RejectedError.from_payload)
@@ -197,7 +196,7 @@ class IotJobsClient(awsiot.MqttServiceClient):
             raise ValueError("callback is required")
 
         return self._subscribe_operation(
-            topic='$aws/things/{0.thing_name}/jobs/get/accepted'.format(request),
+            topic=f'$aws/things/{request.thing_name}/jobs/get/accepted',
             qos=qos,
             callback=callback,
             payload_to_class_fn=GetPendingJobExecutionsResponse.from_payload)
@@ -229,7 +228,7 @@ class IotJobsClient(awsiot.MqttServiceClient):
             raise ValueError("callback is required")
 
         return self._subscribe_operation(
-            topic='$aws/things/{0.thing_name}/jobs/get/rejected'.format(request),
+            topic=f'$aws/things/{request.thing_name}/jobs/get/rejected',
             qos=qos,
             callback=callback,
             payload_to_class_fn=RejectedError.from_payload)
@@ -261,7 +260,7 @@ class IotJobsClient(awsiot.MqttServiceClient):
             raise ValueError("callback is required")
 
         return self._subscribe_operation(
-            topic='$aws/things/{0.thing_name}/jobs/notify'.format(request),
+            topic=f'$aws/things/{request.thing_name}/jobs/notify',
             qos=qos,
             callback=callback,
             payload_to_class_fn=JobExecutionsChangedEvent.from_payload)
@@ -293,7 +292,7 @@ class IotJobsClient(awsiot.MqttServiceClient):
             raise ValueError("callback is required")
 
         return self._subscribe_operation(
-            topic='$aws/things/{0.thing_name}/jobs/notify-next'.format(request),
+            topic=f'$aws/things/{request.thing_name}/jobs/notify-next',
             qos=qos,
             callback=callback,
             payload_to_class_fn=NextJobExecutionChangedEvent.from_payload)
@@ -325,7 +324,7 @@ class IotJobsClient(awsiot.MqttServiceClient):
             raise ValueError("callback is required")
 
         return self._subscribe_operation(
-            topic='$aws/things/{0.thing_name}/jobs/start-next/accepted'.format(request),
+            topic=f'$aws/things/{request.thing_name}/jobs/start-next/accepted',
             qos=qos,
             callback=callback,
             payload_to_class_fn=StartNextJobExecutionResponse.from_payload)
@@ -357,7 +356,7 @@ class IotJobsClient(awsiot.MqttServiceClient):
             raise ValueError("callback is required")
 
         return self._subscribe_operation(
-            topic='$aws/things/{0.thing_name}/jobs/start-next/rejected'.format(request),
+            topic=f'$aws/things/{request.thing_name}/jobs/start-next/rejected',
             qos=qos,
             callback=callback,
             payload_to_class_fn=RejectedError.from_payload)
@@ -391,7 +390,7 @@ class IotJobsClient(awsiot.MqttServiceClient):
             raise ValueError("callback is required")
 
         return self._subscribe_operation(
-            topic='$aws/things/{0.thing_name}/jobs/{0.job_id}/update/accepted'.format(request),
+            topic=f'$aws/things/{request.thing_name}/jobs/{request.job_id}/update/accepted',
             qos=qos,
             callback=callback,
             payload_to_class_fn=UpdateJobExecutionResponse.from_payload)
@@ -425,7 +424,7 @@ class IotJobsClient(awsiot.MqttServiceClient):
             raise ValueError("callback is required")
 
         return self._subscribe_operation(
-            topic='$aws/things/{0.thing_name}/jobs/{0.job_id}/update/rejected'.format(request),
+            topic=f'$aws/things/{request.thing_name}/jobs/{request.job_id}/update/rejected',
             qos=qos,
             callback=callback,
             payload_to_class_fn=RejectedError.from_payload)
@@ -511,7 +510,7 @@ class DescribeJobExecutionResponse(awsiot.ModeledClass):
             new.execution = JobExecutionData.from_payload(val)
         val = payload.get('timestamp')
         if val is not None:
-            new.timestamp = datetime.datetime.fromtimestamp(val)
+            new.timestamp = awsiot._to_datetime(val)
         return new
 
 class DescribeJobExecutionSubscriptionRequest(awsiot.ModeledClass):
@@ -611,7 +610,7 @@ class GetPendingJobExecutionsResponse(awsiot.ModeledClass):
             new.queued_jobs = [JobExecutionSummary.from_payload(i) for i in val]
         val = payload.get('timestamp')
         if val is not None:
-            new.timestamp = datetime.datetime.fromtimestamp(val)
+            new.timestamp = awsiot._to_datetime(val)
         return new
 
 class GetPendingJobExecutionsSubscriptionRequest(awsiot.ModeledClass):
@@ -696,16 +695,16 @@ class JobExecutionData(awsiot.ModeledClass):
             new.job_id = val
         val = payload.get('lastUpdatedAt')
         if val is not None:
-            new.last_updated_at = datetime.datetime.fromtimestamp(val)
+            new.last_updated_at = awsiot._to_datetime(val)
         val = payload.get('queuedAt')
         if val is not None:
-            new.queued_at = datetime.datetime.fromtimestamp(val)
+            new.queued_at = awsiot._to_datetime(val)
         val = payload.get('startedAt')
         if val is not None:
-            new.started_at = datetime.datetime.fromtimestamp(val)
+            new.started_at = awsiot._to_datetime(val)
         val = payload.get('status')
         if val is not None:
-            new.status = val
+            new.status = awsiot._intern(val)
         val = payload.get('statusDetails')
         if val is not None:
             new.status_details = val
@@ -749,7 +748,7 @@ class JobExecutionState(awsiot.ModeledClass):
         new = cls()
         val = payload.get('status')
         if val is not None:
-            new.status = val
+            new.status = awsiot._intern(val)
         val = payload.get('statusDetails')
         if val is not None:
             new.status_details = val
@@ -805,13 +804,13 @@ class JobExecutionSummary(awsiot.ModeledClass):
             new.job_id = val
         val = payload.get('lastUpdatedAt')
         if val is not None:
-            new.last_updated_at = datetime.datetime.fromtimestamp(val)
+            new.last_updated_at = awsiot._to_datetime(val)
         val = payload.get('queuedAt')
         if val is not None:
-            new.queued_at = datetime.datetime.fromtimestamp(val)
+            new.queued_at = awsiot._to_datetime(val)
         val = payload.get('startedAt')
         if val is not None:
-            new.started_at = datetime.datetime.fromtimestamp(val)
+            new.started_at = awsiot._to_datetime(val)
         val = payload.get('versionNumber')
         if val is not None:
             new.version_number = val
@@ -849,7 +848,7 @@ class JobExecutionsChangedEvent(awsiot.ModeledClass):
             new.jobs = {k: [JobExecutionSummary.from_payload(i) for i in v] for k,v in val.items()}
         val = payload.get('timestamp')
         if val is not None:
-            new.timestamp = datetime.datetime.fromtimestamp(val)
+            new.timestamp = awsiot._to_datetime(val)
         return new
 
 class JobExecutionsChangedSubscriptionRequest(awsiot.ModeledClass):
@@ -914,7 +913,7 @@ class NextJobExecutionChangedEvent(awsiot.ModeledClass):
             new.execution = JobExecutionData.from_payload(val)
         val = payload.get('timestamp')
         if val is not None:
-            new.timestamp = datetime.datetime.fromtimestamp(val)
+            new.timestamp = awsiot._to_datetime(val)
         return new
 
 class NextJobExecutionChangedSubscriptionRequest(awsiot.ModeledClass):
@@ -978,7 +977,7 @@ class RejectedError(awsiot.ModeledClass):
             new.client_token = val
         val = payload.get('code')
         if val is not None:
-            new.code = val
+            new.code = awsiot._intern(val)
         val = payload.get('executionState')
         if val is not None:
             new.execution_state = JobExecutionState.from_payload(val)
@@ -987,7 +986,7 @@ class RejectedError(awsiot.ModeledClass):
             new.message = val
         val = payload.get('timestamp')
         if val is not None:
-            new.timestamp = datetime.datetime.fromtimestamp(val)
+            new.timestamp = awsiot._to_datetime(val)
         return new
 
 class RejectedErrorCode:
@@ -1039,7 +1038,7 @@ class StartNextJobExecutionResponse(awsiot.ModeledClass):
             new.execution = JobExecutionData.from_payload(val)
         val = payload.get('timestamp')
         if val is not None:
-            new.timestamp = datetime.datetime.fromtimestamp(val)
+            new.timestamp = awsiot._to_datetime(val)
         return new
 
 class StartNextPendingJobExecutionRequest(awsiot.ModeledClass):
@@ -1214,7 +1213,7 @@ class UpdateJobExecutionResponse(awsiot.ModeledClass):
             new.job_document = val
         val = payload.get('timestamp')
         if val is not None:
-            new.timestamp = datetime.datetime.fromtimestamp(val)
+            new.timestamp = awsiot._to_datetime(val)
         return new
 
 class UpdateJobExecutionSubscriptionRequest(awsiot.ModeledClass):
@@ -42,5 +42,8 @@ setup(
     install_requires=[
         'awscrt==0.11.25',
     ],
+    extras_require={
+        'orjson': ['orjson'],
+    },
     python_requires='>=3.6',
 )
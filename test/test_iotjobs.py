@@ -0,0 +1,262 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0.
+from awsiot import iotjobs
+import datetime
+import json
+import unittest
+
+TIMESTAMP = 1600000000
+
+EXECUTION_PAYLOAD = {
+    'executionNumber': 3,
+    'jobDocument': {'operation': 'reboot', 'steps': [1, 2]},
+    'jobId': 'job-1',
+    'lastUpdatedAt': TIMESTAMP + 1,
+    'queuedAt': TIMESTAMP + 2,
+    'startedAt': TIMESTAMP + 3,
+    'status': 'IN_PROGRESS',
+    'statusDetails': {'progress': '50%'},
+    'thingName': 'my-thing',
+    'versionNumber': 2,
+}
+
+SUMMARY_PAYLOAD = {
+    'executionNumber': 1,
+    'jobId': 'job-2',
+    'lastUpdatedAt': TIMESTAMP + 4,
+    'queuedAt': TIMESTAMP + 5,
+    'startedAt': TIMESTAMP + 6,
+    'versionNumber': 0,
+}
+
+STATE_PAYLOAD = {
+    'status': 'QUEUED',
+    'statusDetails': {'key': 'value'},
+    'versionNumber': 5,
+}
+
+RESPONSE_CLASSES = [
+    iotjobs.DescribeJobExecutionResponse,
+    iotjobs.GetPendingJobExecutionsResponse,
+    iotjobs.JobExecutionData,
+    iotjobs.JobExecutionState,
+    iotjobs.JobExecutionSummary,
+    iotjobs.JobExecutionsChangedEvent,
+    iotjobs.NextJobExecutionChangedEvent,
+    iotjobs.RejectedError,
+    iotjobs.StartNextJobExecutionResponse,
+    iotjobs.UpdateJobExecutionResponse,
+]
+
+
+def _dt(val):
+    return datetime.datetime.fromtimestamp(val)
+
+
+class FromPayloadTest(unittest.TestCase):
+
+    def assert_execution(self, execution):
+        self.assertIsInstance(execution, iotjobs.JobExecutionData)
+        self.assertEqual(3, execution.execution_number)
+        self.assertEqual({'operation': 'reboot', 'steps': [1, 2]}, execution.job_document)
+        self.assertEqual('job-1', execution.job_id)
+        self.assertEqual(_dt(TIMESTAMP + 1), execution.last_updated_at)
+        self.assertEqual(_dt(TIMESTAMP + 2), execution.queued_at)
+        self.assertEqual(_dt(TIMESTAMP + 3), execution.started_at)
+        self.assertEqual('IN_PROGRESS', execution.status)
+        self.assertEqual({'progress': '50%'}, execution.status_details)
+        self.assertEqual('my-thing', execution.thing_name)
+        self.assertEqual(2, execution.version_number)
+
+    def assert_summary(self, summary):
+        self.assertIsInstance(summary, iotjobs.JobExecutionSummary)
+        self.assertEqual(1, summary.execution_number)
+        self.assertEqual('job-2', summary.job_id)
+        self.assertEqual(_dt(TIMESTAMP + 4), summary.last_updated_at)
+        self.assertEqual(_dt(TIMESTAMP + 5), summary.queued_at)
+        self.assertEqual(_dt(TIMESTAMP + 6), summary.started_at)
+        self.assertEqual(0, summary.version_number)
+
+    def assert_state(self, state):
+        self.assertIsInstance(state, iotjobs.JobExecutionState)
+        self.assertEqual('QUEUED', state.status)
+        self.assertEqual({'key': 'value'}, state.status_details)
+        self.assertEqual(5, state.version_number)
+
+    def test_empty_payload(self):
+        for cls in RESPONSE_CLASSES:
+            with self.subTest(cls=cls.__name__):
+                obj = cls.from_payload({})
+                self.assertIsInstance(obj, cls)
+                for attr in cls.__slots__:
+                    self.assertIsNone(getattr(obj, attr))
+
+    def test_all_null_payload(self):
+        payload = {key: None for key in (
+            'clientToken', 'code', 'execution', 'executionNumber', 'executionState', 'inProgressJobs',
+            'jobDocument', 'jobId', 'jobs', 'lastUpdatedAt', 'message', 'queuedAt', 'queuedJobs',
+            'startedAt', 'status', 'statusDetails', 'thingName', 'timestamp', 'versionNumber')}
+        for cls in RESPONSE_CLASSES:
+            with self.subTest(cls=cls.__name__):
+                obj = cls.from_payload(payload)
+                for attr in cls.__slots__:
+                    self.assertIsNone(getattr(obj, attr))
+
+    def test_unknown_keys_ignored(self):
+        obj = iotjobs.JobExecutionState.from_payload({'status': 'FAILED', 'unexpected': 1})
+        self.assertEqual('FAILED', obj.status)
+        self.assertIsNone(obj.status_details)
+        self.assertIsNone(obj.version_number)
+
+    def test_job_execution_data(self):
+        self.assert_execution(iotjobs.JobExecutionData.from_payload(EXECUTION_PAYLOAD))
+
+    def test_job_execution_summary(self):
+        self.assert_summary(iotjobs.JobExecutionSummary.from_payload(SUMMARY_PAYLOAD))
+
+    def test_describe_job_execution_response(self):
+        obj = iotjobs.DescribeJobExecutionResponse.from_payload(
+            {'clientToken': 'token', 'execution': EXECUTION_PAYLOAD, 'timestamp': TIMESTAMP})
+        self.assertEqual('token', obj.client_token)
+        self.assert_execution(obj.execution)
+        self.assertEqual(_dt(TIMESTAMP), obj.timestamp)
+
+    def test_start_next_job_execution_response(self):
+        obj = iotjobs.StartNextJobExecutionResponse.from_payload({'execution': EXECUTION_PAYLOAD})
+        self.assertIsNone(obj.client_token)
+        self.assert_execution(obj.execution)
+        self.assertIsNone(obj.timestamp)
+
+    def test_next_job_execution_changed_event(self):
+        obj = iotjobs.NextJobExecutionChangedEvent.from_payload(
+            {'execution': EXECUTION_PAYLOAD, 'timestamp': TIMESTAMP})
+        self.assert_execution(obj.execution)
+        self.assertEqual(_dt(TIMESTAMP), obj.timestamp)
+
+    def test_get_pending_job_executions_response(self):
+        obj = iotjobs.GetPendingJobExecutionsResponse.from_payload({
+            'clientToken': 'token',
+            'inProgressJobs': [SUMMARY_PAYLOAD],
+            'queuedJobs': [SUMMARY_PAYLOAD, SUMMARY_PAYLOAD],
+            'timestamp': TIMESTAMP})
+        self.assertEqual('token', obj.client_token)
+        self.assertEqual(1, len(obj.in_progress_jobs))
+        self.assertEqual(2, len(obj.queued_jobs))
+        for summary in obj.in_progress_jobs + obj.queued_jobs:
+            self.assert_summary(summary)
+        self.assertEqual(_dt(TIMESTAMP), obj.timestamp)
+
+    def test_get_pending_job_executions_response_empty_lists(self):
+        obj = iotjobs.GetPendingJobExecutionsResponse.from_payload({'inProgressJobs': [], 'queuedJobs': []})
+        self.assertEqual([], obj.in_progress_jobs)
+        self.assertEqual([], obj.queued_jobs)
+
+    def test_job_executions_changed_event(self):
+        obj = iotjobs.JobExecutionsChangedEvent.from_payload({
+            'jobs': {'QUEUED': [SUMMARY_PAYLOAD], 'IN_PROGRESS': []},
+            'timestamp': TIMESTAMP})
+        self.assertEqual({'QUEUED', 'IN_PROGRESS'}, set(obj.jobs))
+        self.assertEqual(1, len(obj.jobs['QUEUED']))
+        self.assert_summary(obj.jobs['QUEUED'][0])
+        self.assertEqual([], obj.jobs['IN_PROGRESS'])
+        self.assertEqual(_dt(TIMESTAMP), obj.timestamp)
+
+    def test_rejected_error(self):
+        obj = iotjobs.RejectedError.from_payload({
+            'clientToken': 'token',
+            'code': 'InvalidStateTransition',
+            'executionState': STATE_PAYLOAD,
+            'message': 'nope',
+            'timestamp': TIMESTAMP})
+        self.assertEqual('token', obj.client_token)
+        self.assertEqual('InvalidStateTransition', obj.code)
+        self.assert_state(obj.execution_state)
+        self.assertEqual('nope', obj.message)
+        self.assertEqual(_dt(TIMESTAMP), obj.timestamp)
+
+    def test_update_job_execution_response(self):
+        obj = iotjobs.UpdateJobExecutionResponse.from_payload({
+            'clientToken': 'token',
+            'executionState': STATE_PAYLOAD,
+            'jobDocument': {'a': 1},
+            'timestamp': TIMESTAMP})
+        self.assertEqual('token', obj.client_token)
+        self.assert_state(obj.execution_state)
+        self.assertEqual({'a': 1}, obj.job_document)
+        self.assertEqual(_dt(TIMESTAMP), obj.timestamp)
+
+    def test_float_timestamp(self):
+        obj = iotjobs.UpdateJobExecutionResponse.from_payload({'timestamp': TIMESTAMP + 0.5})
+        self.assertEqual(_dt(TIMESTAMP + 0.5), obj.timestamp)
+
+    def test_falsy_values_kept(self):
+        obj = iotjobs.JobExecutionData.from_payload(
+            {'executionNumber': 0, 'jobDocument': {}, 'jobId': '', 'statusDetails': {}, 'versionNumber': 0})
+        self.assertEqual(0, obj.execution_number)
+        self.assertEqual({}, obj.job_document)
+        self.assertEqual('', obj.job_id)
+        self.assertEqual({}, obj.status_details)
+        self.assertEqual(0, obj.version_number)
+
+    def test_non_str_status_passed_through(self):
+        self.assertEqual(['x'], iotjobs.JobExecutionState.from_payload({'status': ['x']}).status)
+        self.assertEqual({'a': 1}, iotjobs.RejectedError.from_payload({'code': {'a': 1}}).code)
+
+    def test_status_and_code_match_constants(self):
+        payload = json.loads('{"status": "IN_PROGRESS", "executionState": {"status": "SUCCEEDED"}, '
+                             '"code": "ResourceNotFound"}')
+        self.assertIs(iotjobs.JobStatus.IN_PROGRESS, iotjobs.JobExecutionData.from_payload(payload).status)
+        rejected = iotjobs.RejectedError.from_payload(payload)
+        self.assertIs(iotjobs.RejectedErrorCode.RESOURCE_NOT_FOUND, rejected.code)
+        self.assertIs(iotjobs.JobStatus.SUCCEEDED, rejected.execution_state.status)
+
+
+class ToPayloadTest(unittest.TestCase):
+
+    def test_unset_fields_omitted(self):
+        for cls in (iotjobs.DescribeJobExecutionRequest,
+                    iotjobs.GetPendingJobExecutionsRequest,
+                    iotjobs.StartNextPendingJobExecutionRequest,
+                    iotjobs.UpdateJobExecutionRequest):
+            with self.subTest(cls=cls.__name__):
+                self.assertEqual({}, cls(thing_name='my-thing').to_payload())
+
+    def test_topic_fields_not_in_payload(self):
+        request = iotjobs.UpdateJobExecutionRequest(thing_name='my-thing', job_id='job-1', status='FAILED')
+        self.assertEqual({'status': 'FAILED'}, request.to_payload())
+
+    def test_describe_job_execution_request(self):
+        request = iotjobs.DescribeJobExecutionRequest(
+            thing_name='my-thing', job_id='job-1', client_token='token', execution_number=0,
+            include_job_document=False)
+        self.assertEqual({'clientToken': 'token', 'executionNumber': 0, 'includeJobDocument': False},
+                         request.to_payload())
+
+    def test_get_pending_job_executions_request(self):
+        request = iotjobs.GetPendingJobExecutionsRequest(thing_name='my-thing', client_token='token')
+        self.assertEqual({'clientToken': 'token'}, request.to_payload())
+
+    def test_start_next_pending_job_execution_request(self):
+        request = iotjobs.StartNextPendingJobExecutionRequest(
+            thing_name='my-thing', status_details={}, step_timeout_in_minutes=0)
+        self.assertEqual({'statusDetails': {}, 'stepTimeoutInMinutes': 0}, request.to_payload())
+
+    def test_update_job_execution_request(self):
+        request = iotjobs.UpdateJobExecutionRequest(
+            thing_name='my-thing', job_id='job-1', client_token='token', execution_number=1,
+            expected_version=0, include_job_document=True, include_job_execution_state=False,
+            status='SUCCEEDED', status_details={'k': 'v'}, step_timeout_in_minutes=3)
+        self.assertEqual({
+            'clientToken': 'token',
+            'executionNumber': 1,
+            'expectedVersion': 0,
+            'includeJobDocument': True,
+            'includeJobExecutionState': False,
+            'status': 'SUCCEEDED',
+            'statusDetails': {'k': 'v'},
+            'stepTimeoutInMinutes': 3,
+        }, request.to_payload())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0.
+import awsiot
+import importlib.util
+import json
+import unittest
+
+JSON_IMPLS = ['json']
+if importlib.util.find_spec('orjson') is not None:
+    JSON_IMPLS.append('orjson')
+
+
+class JsonImplTest(unittest.TestCase):
+    """Payloads must encode and decode the same with every supported JSON implementation"""
+
+    def setUp(self):
+        self._original_impl = awsiot._JSON_IMPL
+
+    def tearDown(self):
+        awsiot.set_json_implementation(self._original_impl)
+
+    def test_default_is_stdlib(self):
+        self.assertEqual('json', self._original_impl)
+
+    def test_unsupported_impl(self):
+        with self.assertRaises(ValueError):
+            awsiot.set_json_implementation('simplejson')
+        self.assertEqual(self._original_impl, awsiot._JSON_IMPL)
+
+    def test_encode_non_str_keys(self):
+        for impl in JSON_IMPLS:
+            with self.subTest(impl=impl):
+                awsiot.set_json_implementation(impl)
+                encoded = awsiot._json_dumps({'desired': {1: 'a'}})
+                self.assertIsInstance(encoded, bytes)
+                self.assertEqual({'desired': {'1': 'a'}}, json.loads(encoded))
+
+    def test_encode_big_int(self):
+        for impl in JSON_IMPLS:
+            with self.subTest(impl=impl):
+                awsiot.set_json_implementation(impl)
+                encoded = awsiot._json_dumps({'value': 2**70})
+                self.assertEqual({'value': 2**70}, json.loads(encoded))
+
+    def test_decode_big_int(self):
+        for impl in JSON_IMPLS:
+            with self.subTest(impl=impl):
+                awsiot.set_json_implementation(impl)
+                decoded = awsiot._json_loads(b'{"value": 12345678901234567890123}')
+                self.assertEqual(12345678901234567890123, decoded['value'])
+                self.assertIsInstance(decoded['value'], int)
+
+
+if __name__ == '__main__':
+    unittest.main()